@@ -12,72 +12,134 @@ License: MIT
 """
 
 import asyncio
-import json
 import logging
+import os
+import queue
 import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, List, Optional, Any, Union
 
 import httpx
+import msgspec
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from pydantic import BaseModel
+
+try:
+    import uvloop  # noqa: F401
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    # uvloop is not available on Windows; fall back to the stdlib loop
+    EVENT_LOOP = "asyncio"
 
 # Configure logging
+# Records are formatted by the QueueHandler and written to the log file and
+# console by a background listener thread, so disk I/O never blocks the
+# event loop
+log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/home/ec2-user/llm-service/logs/app.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(log_queue)]
+)
+log_listener = QueueListener(
+    log_queue,
+    logging.FileHandler('/home/ec2-user/llm-service/logs/app.log'),
+    logging.StreamHandler(),
+    respect_handler_level=True
 )
+log_listener.start()
 logger = logging.getLogger(__name__)
 
 # Configuration
 OLLAMA_BASE_URL = "http://localhost:11434"
+# Ollama endpoints, parsed once instead of on every request
+OLLAMA_CHAT_URL = httpx.URL(f"{OLLAMA_BASE_URL}/api/chat")
+OLLAMA_TAGS_URL = httpx.URL(f"{OLLAMA_BASE_URL}/api/tags")
+OLLAMA_SHOW_URL = httpx.URL(f"{OLLAMA_BASE_URL}/api/show")
+OLLAMA_GENERATE_URL = httpx.URL(f"{OLLAMA_BASE_URL}/api/generate")
 DEFAULT_MODEL = "llama3.1:8b"
 REQUEST_TIMEOUT = 720  # 12 minutes
+OLLAMA_SOCKET = os.getenv("OLLAMA_SOCKET")  # Optional Unix socket exposed by Ollama
+TAGS_CACHE_TTL = 3.0  # Seconds to reuse Ollama's /api/tags response
+TAGS_TIMEOUT = 5.0  # Seconds before a /api/tags request is treated as failed
+WARMUP = os.getenv("WARMUP") == "1"  # Load DEFAULT_MODEL into memory at startup
+# Comma-separated browser origins allowed to call the API, e.g.
+# "https://app.example.com,https://admin.example.com"
+CORS_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()]
+# Optional minimum size in bytes of each streamed chunk. httpx holds data back
+# until this many bytes have arrived, so only set it when throughput matters
+# more than per-token latency. Unset forwards data as soon as it is read.
+OLLAMA_STREAM_CHUNK = int(os.getenv("OLLAMA_STREAM_CHUNK", "0")) or None
 
-# Pydantic Models - Compatible with Strands SDK and Ollama tool calls
-class ToolCall(BaseModel):
+# Headers for request bodies that are pre-serialized with orjson
+_POST_HEADERS = {"content-type": "application/json", "accept": "application/json"}
+
+# msgspec Structs - Compatible with Strands SDK and Ollama tool calls
+# Chat requests are decoded straight into these structs, which encode back
+# to exactly the message format Ollama expects.
+class ToolCall(msgspec.Struct):
     """Tool call structure for function calling."""
-    function: Dict[str, Any] = Field(..., description="Function call details")
+    function: Dict[str, Any]  # Function call details
 
-class ChatMessage(BaseModel):
+class ChatMessage(msgspec.Struct, omit_defaults=True):
     """
     Chat message that can handle both regular content and tool calls.
     This is compatible with Strands SDK tool calling patterns.
     """
-    role: str = Field(..., description="Role of the message sender")
-    content: Optional[str] = Field(default=None, description="Content of the message")
-    tool_calls: Optional[List[ToolCall]] = Field(default=None, description="Tool calls made by assistant")
-    
+    role: str  # Role of the message sender
+    content: Optional[str] = None  # Content of the message
+    tool_calls: Optional[List[ToolCall]] = None  # Tool calls made by assistant
+
     # Ensure at least one of content or tool_calls is present
-    def __init__(self, **data):
-        super().__init__(**data)
-        if not self.content and not self.tool_calls:
-            # If neither is provided, set empty content to avoid validation errors
-            self.content = ""
+    def __post_init__(self):
+        if not self.content:
+            # Provide empty content unless the message carries tool calls
+            self.content = None if self.tool_calls else ""
 
-class ChatRequest(BaseModel):
+class ChatRequest(msgspec.Struct):
     """
     Chat request format compatible with both Strands SDK and Ollama.
     This matches the format that Strands OllamaModel sends, including tool calls.
     """
-    messages: List[ChatMessage] = Field(..., description="List of chat messages")
-    model: str = Field(default=DEFAULT_MODEL, description="Model to use")
-    stream: Optional[bool] = Field(default=False, description="Whether to stream response")
-    # Additional Ollama-specific parameters
-    options: Optional[Dict[str, Any]] = Field(default=None, description="Ollama options")
-    tools: Optional[List[Dict[str, Any]]] = Field(default=None, description="Available tools")
-    keep_alive: Optional[str] = Field(default=None, description="Keep alive duration")
+    messages: List[ChatMessage]
+    model: str = DEFAULT_MODEL
+    stream: Optional[bool] = False
+    # Additional Ollama-specific parameters, left out of the encoded
+    # request unless the client sent them
+    options: Union[Dict[str, Any], None, msgspec.UnsetType] = msgspec.UNSET
+    tools: Union[List[Dict[str, Any]], None, msgspec.UnsetType] = msgspec.UNSET
+    keep_alive: Union[str, None, msgspec.UnsetType] = msgspec.UNSET
+
+    def __post_init__(self):
+        # Treat "stream": null as False; forwarding null would make Ollama stream
+        if self.stream is None:
+            self.stream = False
+
+# Chat request codecs, built once so each request runs a specialized decoder
+_chat_decoder = msgspec.json.Decoder(ChatRequest)
+_chat_encoder = msgspec.json.Encoder()
 
+# OpenAPI schema for the /api/chat request body. The endpoint reads the raw
+# body, so FastAPI cannot derive it; the referenced structs are added to the
+# app's schema components below.
+(_CHAT_REQUEST_SCHEMA,), _CHAT_SCHEMA_COMPONENTS = msgspec.json.schema_components(
+    [ChatRequest], ref_template="#/components/schemas/{name}"
+)
+
+# Pydantic Models
+# Endpoints that return timestamps (these models via model_dump(), and the
+# root endpoint) return an ORJSONResponse directly. That skips FastAPI's
+# jsonable_encoder pass, so datetimes reach orjson as datetime objects and
+# are serialized natively.
 class HealthResponse(BaseModel):
     status: str
-    timestamp: str
+    timestamp: datetime
     ollama_status: str
     available_models: List[str]
 
@@ -87,89 +149,231 @@ app = FastAPI(
     description="Production-ready LLM service compatible with Strands SDK OllamaModel and tool calling",
     version="1.0.1",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+_default_openapi = app.openapi
+
+def chat_openapi():
+    """Generate the OpenAPI schema, including the msgspec chat request structs."""
+    if app.openapi_schema is None:
+        schema = _default_openapi()
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(_CHAT_SCHEMA_COMPONENTS)
+    return app.openapi_schema
+
+app.openapi = chat_openapi
+
+# Add CORS middleware only when browser clients are configured
+# Server-to-server callers such as the Strands SDK do not need CORS, so by
+# default no middleware runs on each request
+if CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ORIGINS,
+        allow_origin_regex=None,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 # HTTP client for Ollama communication
-http_client = httpx.AsyncClient(timeout=REQUEST_TIMEOUT)
+# Keep a large pool of warm connections so concurrent agent requests do not
+# reconnect to Ollama. HTTP/2 is negotiated when Ollama is reached over TLS.
+http_client = httpx.AsyncClient(
+    timeout=REQUEST_TIMEOUT,
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=256,
+            max_keepalive_connections=64,
+            keepalive_expiry=600
+        ),
+        retries=0,
+        uds=OLLAMA_SOCKET
+    )
+)
+
+# Short-lived cache of Ollama's /api/tags response, shared by the health
+# check and the models endpoint so frequent load balancer probes do not
+# each hit Ollama. Failures are cached too, so callers waiting on the lock
+# do not each retry a failing or hung Ollama.
+_tags_cache = {"expires": 0.0, "value": None, "error": None}
+_tags_lock = asyncio.Lock()
+
+def _cached_tags() -> Dict[str, Any]:
+    """Return the cached /api/tags response, or re-raise the cached failure."""
+    if _tags_cache["error"] is not None:
+        raise _tags_cache["error"]
+    return _tags_cache["value"]
+
+async def _get_tags() -> Dict[str, Any]:
+    """
+    Get Ollama's /api/tags response, cached for TAGS_CACHE_TTL seconds.
+    Concurrent callers share a single in-flight request to Ollama and its
+    result or exception.
+    Raises httpx.HTTPStatusError if Ollama does not respond with 200.
+    """
+    if time.monotonic() < _tags_cache["expires"]:
+        return _cached_tags()
+
+    async with _tags_lock:
+        # Another caller may have refreshed the cache while we waited
+        if time.monotonic() < _tags_cache["expires"]:
+            return _cached_tags()
+
+        try:
+            response = await http_client.get(OLLAMA_TAGS_URL, timeout=TAGS_TIMEOUT)
+            if response.status_code != 200:
+                raise httpx.HTTPStatusError(
+                    f"Failed to fetch models: {response.status_code}",
+                    request=response.request,
+                    response=response
+                )
+            _tags_cache.update(value=orjson.loads(response.content), error=None)
+        except Exception as e:
+            _tags_cache.update(value=None, error=e)
+
+        _tags_cache["expires"] = time.monotonic() + TAGS_CACHE_TTL
+        return _cached_tags()
 
 async def check_ollama_health() -> Dict[str, Any]:
     """Check if Ollama service is running and get available models."""
     try:
-        response = await http_client.get(f"{OLLAMA_BASE_URL}/api/tags")
-        if response.status_code == 200:
-            models_data = response.json()
-            models = [model["name"] for model in models_data.get("models", [])]
-            return {"status": "healthy", "models": models}
-        else:
-            return {"status": "unhealthy", "models": []}
+        models_data = await _get_tags()
+        models = [model["name"] for model in models_data.get("models", [])]
+        return {"status": "healthy", "models": models}
+    except httpx.HTTPStatusError:
+        return {"status": "unhealthy", "models": []}
     except Exception as e:
-        logger.error(f"Ollama health check failed: {e}")
+        logger.error("Ollama health check failed: %s", e)
         return {"status": "unhealthy", "models": []}
 
-def format_message_for_ollama(message: ChatMessage) -> Dict[str, Any]:
+async def open_chat_stream(body: bytes) -> httpx.Response:
     """
-    Format a ChatMessage for Ollama, handling both content and tool calls.
+    Send a pre-serialized request to Ollama's /api/chat endpoint and return
+    the response without reading its body. Raises HTTPException if Ollama
+    does not respond with 200.
     """
-    ollama_message = {"role": message.role}
-    
-    if message.content:
-        ollama_message["content"] = message.content
-    
-    if message.tool_calls:
-        # Convert tool calls to Ollama format
-        ollama_message["tool_calls"] = []
-        for tool_call in message.tool_calls:
-            ollama_message["tool_calls"].append({
-                "function": tool_call.function
-            })
-    
-    # If neither content nor tool_calls, provide empty content
-    if not message.content and not message.tool_calls:
-        ollama_message["content"] = ""
-    
-    return ollama_message
+    upstream = await http_client.send(
+        http_client.build_request(
+            "POST",
+            OLLAMA_CHAT_URL,
+            content=body,
+            headers=_POST_HEADERS
+        ),
+        stream=True
+    )
+
+    if upstream.status_code != 200:
+        await upstream.aread()
+        await upstream.aclose()
+        logger.error("Ollama request failed: %d - %s", upstream.status_code, upstream.text)
+        raise HTTPException(
+            status_code=upstream.status_code,
+            detail=f"Ollama request failed: {upstream.text}"
+        )
+
+    return upstream
+
+def stream_upstream(upstream: httpx.Response) -> StreamingResponse:
+    """
+    Relay an open Ollama response to the client byte-for-byte as it arrives.
+    The upstream response is closed by a background task, which Starlette
+    runs even if the client disconnects before the body is streamed.
+    """
+    async def stream_response():
+        async for chunk in upstream.aiter_raw(chunk_size=OLLAMA_STREAM_CHUNK):
+            yield chunk
+
+    return StreamingResponse(
+        stream_response(),
+        media_type=upstream.headers.get("content-type", "application/x-ndjson"),
+        headers={"X-Accel-Buffering": "no", "Cache-Control": "no-cache"},
+        background=BackgroundTask(upstream.aclose)
+    )
 
 @app.get("/", tags=["General"])
 async def root():
     """Root endpoint with service information."""
-    return {
+    return ORJSONResponse({
         "service": "LLM Service - Strands SDK Compatible",
         "version": "1.0.1",
         "status": "running",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.utcnow(),
         "compatibility": "Strands SDK OllamaModel with tool calling support",
         "endpoints": {
             "health": "/health",
+            "liveness": "/livez",
+            "readiness": "/readyz",
             "chat": "/api/chat",
+            "chat_raw": "/api/chat/raw",
             "models": "/api/models",
             "docs": "/docs"
         }
-    }
+    })
 
-@app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check():
-    """Health check endpoint for monitoring and load balancers."""
+@app.get("/livez", tags=["Health"])
+async def liveness_check():
+    """Liveness probe - answers without contacting Ollama."""
+    return {"status": "ok"}
+
+async def get_health_status() -> HealthResponse:
+    """Build the health report, backed by the cached Ollama /api/tags response."""
     ollama_health = await check_ollama_health()
     
+    if ollama_health["status"] != "healthy":
+        status = "degraded"
+    elif _warmup_task is not None and not _warmup_task.done():
+        status = "warming_up"
+    else:
+        status = "healthy"
+
     return HealthResponse(
-        status="healthy" if ollama_health["status"] == "healthy" else "degraded",
-        timestamp=datetime.utcnow().isoformat(),
+        status=status,
+        timestamp=datetime.utcnow(),
         ollama_status=ollama_health["status"],
         available_models=ollama_health["models"]
     )
 
-@app.post("/api/chat", tags=["Chat"])
-async def chat_completion(request: ChatRequest):
+@app.get("/health", response_model=HealthResponse, tags=["Health"])
+async def health_check():
+    """
+    Health check endpoint for monitoring.
+    Always answers 200; the body reports whether Ollama is healthy.
+    """
+    health = await get_health_status()
+    return ORJSONResponse(health.model_dump())
+
+@app.get(
+    "/readyz",
+    response_model=HealthResponse,
+    responses={503: {"model": HealthResponse, "description": "Ollama is not healthy or the model is warming up"}},
+    tags=["Health"]
+)
+async def readiness_check():
+    """
+    Readiness probe for load balancer target groups.
+    Answers 503 while Ollama is not healthy or the startup warmup is still
+    running, so the host is kept out of rotation.
+    """
+    health = await get_health_status()
+    return ORJSONResponse(
+        health.model_dump(),
+        status_code=200 if health.status == "healthy" else 503
+    )
+
+@app.post(
+    "/api/chat",
+    tags=["Chat"],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _CHAT_REQUEST_SCHEMA}}
+        }
+    }
+)
+async def chat_completion(http_request: Request):
     """
     Chat completion endpoint compatible with Strands SDK OllamaModel.
     
@@ -181,74 +385,69 @@ async def chat_completion(request: ChatRequest):
     and expects responses in Ollama's native streaming format.
     """
     try:
-        logger.info(f"Processing chat request for model: {request.model}")
-        logger.info(f"Request has {len(request.messages)} messages")
-        
+        request = _chat_decoder.decode(await http_request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid chat request: {e}")
+
+    try:
+        n_content = sum(1 for msg in request.messages if msg.content)
+        n_tools = sum(1 for msg in request.messages if msg.tool_calls)
+        logger.info(
+            "Processing chat request: model=%s messages=%d with_content=%d with_tool_calls=%d",
+            request.model, len(request.messages), n_content, n_tools
+        )
+
         # Log message types for debugging
-        for i, msg in enumerate(request.messages):
-            has_content = bool(msg.content)
-            has_tools = bool(msg.tool_calls)
-            logger.info(f"Message {i}: role={msg.role}, has_content={has_content}, has_tool_calls={has_tools}")
-        
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, msg in enumerate(request.messages):
+                has_content = bool(msg.content)
+                has_tools = bool(msg.tool_calls)
+                logger.debug("Message %d: role=%s, has_content=%s, has_tool_calls=%s", i, msg.role, has_content, has_tools)
+
         start_time = time.time()
 
         # Prepare request for Ollama's /api/chat endpoint
-        # Format messages properly for Ollama
-        ollama_messages = []
-        for message in request.messages:
-            ollama_message = format_message_for_ollama(message)
-            ollama_messages.append(ollama_message)
-        
-        ollama_request = {
-            "model": request.model,
-            "messages": ollama_messages,
-            "stream": request.stream or False,
-        }
-        
-        # Add optional parameters if provided
-        if request.options:
-            ollama_request["options"] = request.options
-        if request.tools:
-            ollama_request["tools"] = request.tools
-        if request.keep_alive:
-            ollama_request["keep_alive"] = request.keep_alive
+        # Ollama accepts a superset of ChatRequest, so the validated request
+        # is encoded straight to the bytes httpx sends
+        body = _chat_encoder.encode(request)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Forwarding request to Ollama: %s", body.decode())
 
-        logger.debug(f"Forwarding request to Ollama: {json.dumps(ollama_request, indent=2)}")
+        # For streaming requests, proxy Ollama's byte stream as it is produced
+        # instead of buffering the whole response first
+        if request.stream:
+            upstream = await open_chat_stream(body)
+            logger.info("Stream started in %.2f seconds", time.time() - start_time)
+            return stream_upstream(upstream)
 
         # Forward request to Ollama's /api/chat endpoint
         response = await http_client.post(
-            f"{OLLAMA_BASE_URL}/api/chat",
-            json=ollama_request,
-            timeout=REQUEST_TIMEOUT
+            OLLAMA_CHAT_URL,
+            content=body,
+            headers=_POST_HEADERS
         )
 
         processing_time = time.time() - start_time
-        logger.info(f"Request processed in {processing_time:.2f} seconds")
+        logger.info("Request processed in %.2f seconds", processing_time)
 
         if response.status_code != 200:
-            logger.error(f"Ollama request failed: {response.status_code} - {response.text}")
+            logger.error("Ollama request failed: %d - %s", response.status_code, response.text)
             raise HTTPException(
                 status_code=response.status_code,
                 detail=f"Ollama request failed: {response.text}"
             )
 
-        # For streaming requests, return the stream
-        if request.stream:
-            async def stream_response():
-                async for chunk in response.aiter_lines():
-                    if chunk:
-                        yield f"{chunk}\n"
-            
-            return StreamingResponse(
-                stream_response(),
-                media_type="application/x-ndjson"
-            )
-        
-        # For non-streaming requests, return the JSON response directly
-        # This preserves Ollama's exact response format
-        ollama_response = response.json()
-        logger.info(f"Ollama response received: {json.dumps(ollama_response, indent=2)}")
-        return ollama_response
+        # For non-streaming requests, return Ollama's bytes unchanged
+        # This preserves Ollama's exact response format without a
+        # parse/re-serialize round trip
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Ollama response received: %s", response.text)
+        return Response(
+            content=response.content,
+            media_type="application/json",
+            status_code=200
+        )
 
     except httpx.TimeoutException:
         logger.error("Request timeout occurred")
@@ -257,35 +456,61 @@ async def chat_completion(request: ChatRequest):
             detail="Request timeout - the model is taking too long to respond"
         )
     except httpx.RequestError as e:
-        logger.error(f"Request error: {e}")
+        logger.error("Request error: %s", e)
         raise HTTPException(
             status_code=503, 
             detail="Unable to connect to Ollama service"
         )
     except Exception as e:
-        logger.error(f"Chat completion error: {e}")
+        logger.error("Chat completion error: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+@app.post("/api/chat/raw", tags=["Chat"])
+async def chat_passthrough(http_request: Request):
+    """
+    Pass-through chat endpoint for clients that already send Ollama's
+    native /api/chat format.
+
+    The request body is forwarded to Ollama unchanged, skipping validation
+    and re-serialization, and Ollama's response is relayed back as it
+    arrives for both streaming and non-streaming requests. Use /api/chat
+    when the request should be validated first.
+    """
+    try:
+        upstream = await open_chat_stream(await http_request.body())
+        return stream_upstream(upstream)
+
+    except httpx.TimeoutException:
+        logger.error("Request timeout occurred")
+        raise HTTPException(
+            status_code=504, 
+            detail="Request timeout - the model is taking too long to respond"
+        )
+    except httpx.RequestError as e:
+        logger.error("Request error: %s", e)
+        raise HTTPException(
+            status_code=503, 
+            detail="Unable to connect to Ollama service"
+        )
+
 @app.get("/api/models", tags=["Models"])
 async def list_models():
     """List available models - proxies to Ollama's /api/tags endpoint."""
     try:
-        response = await http_client.get(f"{OLLAMA_BASE_URL}/api/tags")
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise HTTPException(
-                status_code=500, 
-                detail=f"Failed to fetch models: {response.status_code}"
-            )
+        return await _get_tags()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"Failed to fetch models: {e.response.status_code}"
+        )
     except httpx.RequestError as e:
-        logger.error(f"Failed to connect to Ollama: {e}")
+        logger.error("Failed to connect to Ollama: %s", e)
         raise HTTPException(
             status_code=503, 
             detail="Unable to connect to Ollama service"
         )
     except Exception as e:
-        logger.error(f"List models error: {e}")
+        logger.error("List models error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/models/{model_name}", tags=["Models"])
@@ -293,8 +518,9 @@ async def get_model_info(model_name: str):
     """Get detailed information about a specific model."""
     try:
         response = await http_client.post(
-            f"{OLLAMA_BASE_URL}/api/show",
-            json={"name": model_name}
+            OLLAMA_SHOW_URL,
+            content=orjson.dumps({"name": model_name}),
+            headers=_POST_HEADERS
         )
         if response.status_code == 200:
             return response.json()
@@ -308,7 +534,7 @@ async def get_model_info(model_name: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Get model info error: {e}")
+        logger.error("Get model info error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Additional Ollama-compatible endpoints that Strands SDK might use
@@ -320,9 +546,9 @@ async def generate_completion(request: dict):
     """
     try:
         response = await http_client.post(
-            f"{OLLAMA_BASE_URL}/api/generate",
-            json=request,
-            timeout=REQUEST_TIMEOUT
+            OLLAMA_GENERATE_URL,
+            content=orjson.dumps(request),
+            headers=_POST_HEADERS
         )
         
         if response.status_code != 200:
@@ -334,20 +560,54 @@ async def generate_completion(request: dict):
         return response.json()
         
     except Exception as e:
-        logger.error(f"Generate completion error: {e}")
+        logger.error("Generate completion error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+# Background model warmup started at startup when WARMUP is enabled
+_warmup_task: Optional[asyncio.Task] = None
+
+async def warm_up_model():
+    """
+    Load DEFAULT_MODEL into memory with a one-token chat request and keep it
+    resident, so the first user request does not pay the model load time.
+    """
+    start_time = time.time()
+    try:
+        response = await http_client.post(
+            OLLAMA_CHAT_URL,
+            content=orjson.dumps({
+                "model": DEFAULT_MODEL,
+                "messages": [{"role": "user", "content": "."}],
+                "stream": False,
+                "keep_alive": "24h",
+                "options": {"num_predict": 1}
+            }),
+            headers=_POST_HEADERS
+        )
+        if response.status_code == 200:
+            logger.info("Warmed up model %s in %.2f seconds", DEFAULT_MODEL, time.time() - start_time)
+        else:
+            logger.warning("Model warmup failed: %d - %s", response.status_code, response.text)
+    except Exception as e:
+        logger.warning("Model warmup failed: %s", e)
+
 # Startup and shutdown events
 @app.on_event("startup")
 async def startup_event():
     """Initialize service on startup."""
+    global _warmup_task
     logger.info("LLM Service starting up...")
     logger.info("Service designed for Strands SDK OllamaModel compatibility with tool calling support")
     
     # Check if Ollama is available
     ollama_health = await check_ollama_health()
     if ollama_health["status"] == "healthy":
-        logger.info(f"Ollama is healthy with {len(ollama_health['models'])} models available")
+        logger.info("Ollama is healthy with %d models available", len(ollama_health["models"]))
+        if WARMUP:
+            # Run in the background so the server starts listening right away;
+            # /readyz reports not-ready until the warmup finishes
+            _warmup_task = asyncio.create_task(warm_up_model())
+            logger.info("Warming up model %s in the background", DEFAULT_MODEL)
         logger.info("Ready to serve Strands SDK requests with tool calling support")
     else:
         logger.warning("Ollama service is not healthy - some endpoints may not work")
@@ -356,13 +616,18 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("LLM Service shutting down...")
+    if _warmup_task is not None:
+        _warmup_task.cancel()
     await http_client.aclose()
+    log_listener.stop()
 
 if __name__ == "__main__":
     uvicorn.run(
         app, 
         host="0.0.0.0", 
         port=8000, 
+        loop=EVENT_LOOP,
+        http="httptools",
         timeout_keep_alive=720,
         timeout_graceful_shutdown=720,
         log_level="info"
@@ -48,7 +48,7 @@ if [ ! -f /home/ec2-user/llm-service/fastapi.pid ]; then
     # Wait for FastAPI to be ready
     echo "Waiting for FastAPI to be ready..."
     for i in {1..30}; do
-        if curl -s http://localhost:8000/health > /dev/null 2>&1; then
+        if curl -s http://localhost:8000/livez > /dev/null 2>&1; then
             echo "✅ FastAPI is ready"
             break
         fi
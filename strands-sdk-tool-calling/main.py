@@ -12,8 +12,12 @@ This application shows how to:
 Based on: https://github.com/strands-agents/samples
 """
 
+import asyncio
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import httpx
 from dotenv import load_dotenv
 
 from strands import Agent
@@ -24,26 +28,40 @@ from strands_tools.calculator import calculator
 load_dotenv()
 
 # Configure logging
+# File and console writes happen on a background listener thread
+log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(log_queue)]
 )
+log_listener = QueueListener(
+    log_queue,
+    logging.FileHandler('app.log'),
+    logging.StreamHandler(),
+    respect_handler_level=True
+)
+log_listener.start()
 logger = logging.getLogger(__name__)
 
 
-def main():
+async def main():
     """Simple demonstration of Strands SDK agents with tool calling."""
 
     logger.info("🚀 Starting Strands SDK Application...")
 
+    # OllamaModel creates a new Ollama client for every model call, so share
+    # one transport between them to keep connections to the LLM service warm
+    # across both agents and all of their requests
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_keepalive_connections=8)
+    )
+
     # Create OllamaModel pointing to your hosted LLM service
     model = OllamaModel(
         model_id=os.getenv("OLLAMA_MODEL", "llama3.1:8b"),
         host=os.getenv("OLLAMA_HOST", "http://localhost:8000"),
+        ollama_client_args={"transport": transport},
         params={
             "max_tokens": int(os.getenv("MAX_TOKENS", "300")),
             "temperature": float(os.getenv("TEMPERATURE", "0.7")),
@@ -52,12 +70,15 @@ def main():
     )
 
     ollama_host = os.getenv('OLLAMA_HOST', 'http://localhost:8000')
-    logger.info(f"🔗 Connected to LLM at: {ollama_host}")
+    logger.info("🔗 Connected to LLM at: %s", ollama_host)
 
     # Create Math Agent
+    # Streamed output is disabled since both agents run concurrently;
+    # answers are printed once they complete
     math_agent = Agent(
         model=model,
         tools=[calculator],
+        callback_handler=None,
         system_prompt="""You are a Math Agent, an expert mathematician.
 
 You have access to a calculator tool. Use it for all mathematical calculations.
@@ -68,6 +89,7 @@ Be concise and show your work."""
     research_agent = Agent(
         model=model,
         tools=[calculator],
+        callback_handler=None,
         system_prompt="""You are a Research Agent, expert at data analysis.
 
 You have access to a calculator tool for statistical calculations.
@@ -76,42 +98,49 @@ Be analytical and show your mathematical work."""
 
     logger.info("✅ Agents initialized successfully")
 
-    # Question 1: Math Agent
     math_question = "What is the square root of 144?"
-    logger.info(f"📝 Asking Math Agent: {math_question}")
+    research_question = "Calculate the average of these numbers: 10, 15, 20, 25, 30"
+    logger.info("📝 Asking Math Agent: %s", math_question)
+    logger.info("📝 Asking Research Agent: %s", research_question)
+
+    # The agents are independent, so ask both questions concurrently
+    math_answer, research_answer = await asyncio.gather(
+        math_agent.invoke_async(math_question),
+        research_agent.invoke_async(research_question),
+        return_exceptions=True
+    )
+    await transport.aclose()
 
-    try:
-        math_answer = math_agent(math_question)
-        logger.info(f"🧮 Math Agent Answer: {math_answer}")
+    # Question 1: Math Agent
+    if isinstance(math_answer, Exception):
+        logger.error("❌ Math Agent error: %s", math_answer)
+        print(f"❌ Math Agent failed: {math_answer}")
+    else:
+        logger.info("🧮 Math Agent Answer: %s", math_answer)
         print(f"\n🧮 MATH AGENT")
         print(f"Question: {math_question}")
         print(f"Answer: {math_answer}")
 
-    except Exception as e:
-        logger.error(f"❌ Math Agent error: {e}")
-        print(f"❌ Math Agent failed: {e}")
-
     print("\n" + "="*50)
 
     # Question 2: Research Agent
-    research_question = "Calculate the average of these numbers: 10, 15, 20, 25, 30"
-    logger.info(f"📝 Asking Research Agent: {research_question}")
-
-    try:
-        research_answer = research_agent(research_question)
-        logger.info(f"📊 Research Agent Answer: {research_answer}")
+    if isinstance(research_answer, Exception):
+        logger.error("❌ Research Agent error: %s", research_answer)
+        print(f"❌ Research Agent failed: {research_answer}")
+    else:
+        logger.info("📊 Research Agent Answer: %s", research_answer)
         print(f"\n📊 RESEARCH AGENT")
         print(f"Question: {research_question}")
         print(f"Answer: {research_answer}")
 
-    except Exception as e:
-        logger.error(f"❌ Research Agent error: {e}")
-        print(f"❌ Research Agent failed: {e}")
-
     print("\n" + "="*50)
     logger.info("🎉 Application completed successfully!")
     print("\n🎉 Demo completed! Check app.log for detailed logs.")
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    finally:
+        # Flush queued log records before exiting
+        log_listener.stop()